@@ -67,7 +67,6 @@ class HandGestureCarControl:
         self.max_frame_skip = 0  # 0 means process every frame, increase for better performance
         
         self.show_loading_screen("Ready to play!")
-        time.sleep(1)  # Show ready message briefly
     
     def init_camera(self):
         """Initialize the camera capture using camera selection interface."""
@@ -83,7 +82,7 @@ class HandGestureCarControl:
             sys.exit(1)
         
         # Let user select a camera
-        selected_camera = select_camera(available_cameras)
+        selected_camera = select_camera(available_cameras, self.screen)
         if selected_camera is None:
             message = "No camera selected. Exiting."
             print(message)
@@ -1,36 +1,11 @@
 # main_menu.py - Game Main Menu
 import pygame
 import sys
+import logging
 import config
+from utils.ui import Button
 
-class Button:
-    def __init__(self, x, y, width, height, text, color, hover_color, text_color, font_size=36):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
-        self.color = color
-        self.hover_color = hover_color
-        self.text_color = text_color
-        self.font_size = font_size
-        self.is_hovered = False
-        
-    def draw(self, screen):
-        # Draw button rectangle
-        color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, (0, 0, 0), self.rect, 2)  # Border
-        
-        # Draw button text
-        font = pygame.font.SysFont(None, self.font_size)
-        text_surf = font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
-    
-    def check_hover(self, pos):
-        self.is_hovered = self.rect.collidepoint(pos)
-        return self.is_hovered
-    
-    def is_clicked(self, pos, click):
-        return self.rect.collidepoint(pos) and click
+logger = logging.getLogger(__name__)
 
 class MainMenu:
     def __init__(self, screen):
@@ -47,6 +22,11 @@ class MainMenu:
         self.text_color = (255, 255, 255)
         self.description_color = (60, 60, 100)
         
+        # Fonts and static text are created once and reused every frame
+        self._fonts = {size: pygame.font.SysFont(None, size) for size in (30, 36, 60)}
+        self._title_text = self._fonts[60].render("Hand Gesture Car Control", True, self.title_color).convert_alpha()
+        self._subtitle_text = self._fonts[36].render("Select Game Mode", True, self.title_color).convert_alpha()
+        
         # Create buttons
         button_width = 300
         button_height = 60
@@ -56,12 +36,12 @@ class MainMenu:
         # Create buttons for each game mode
         self.mode_buttons = {}
         
-        # Debug print to check game modes
-        print("Available game modes:", list(config.GAME_MODES.keys()))
+        # Debug output to check game modes
+        logger.debug("Available game modes: %s", list(config.GAME_MODES.keys()))
         
         # Create a button for each game mode
         for i, (mode_key, mode_info) in enumerate(config.GAME_MODES.items()):
-            print(f"Creating button for mode: {mode_key} - {mode_info['name']}")
+            logger.debug("Creating button for mode: %s - %s", mode_key, mode_info['name'])
             y_pos = button_start_y + i * (button_height + button_spacing)
             self.mode_buttons[mode_key] = Button(
                 self.screen_width // 2 - button_width // 2,
@@ -78,7 +58,7 @@ class MainMenu:
         mode_buttons_end_y = button_start_y + len(config.GAME_MODES) * (button_height + button_spacing)
         last_y = min(mode_buttons_end_y + 20, self.screen_height - button_height - 20)
         
-        print(f"Screen height: {self.screen_height}, Calculated button Y: {last_y}")
+        logger.debug("Screen height: %s, Calculated button Y: %s", self.screen_height, last_y)
         
         self.start_button = Button(
             self.screen_width // 2 - button_width // 2,
@@ -91,67 +71,103 @@ class MainMenu:
             self.text_color,
             42  # Larger font for start button
         )
+        
+        # Pre-render the description for each mode
+        self._desc_texts = {}
+        for mode_key, mode_info in config.GAME_MODES.items():
+            desc_text = self._fonts[30].render(mode_info['description'], True, self.description_color).convert_alpha()
+            self._desc_texts[mode_key] = (desc_text, desc_text.get_rect(center=(self.screen_width//2, 450)))
+        
+        # Everything that doesn't depend on hover/selection is drawn once into a cached background
+        self._bg_cache = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self._bg_cache.fill(self.bg_color)
+        title_rect = self._title_text.get_rect(center=(self.screen_width//2, 100))
+        self._bg_cache.blit(self._title_text, title_rect)
+        subtitle_rect = self._subtitle_text.get_rect(center=(self.screen_width//2, 150))
+        self._bg_cache.blit(self._subtitle_text, subtitle_rect)
+        for button in self.mode_buttons.values():
+            button.draw(self._bg_cache)
+        self.start_button.draw(self._bg_cache)
+    
+    def reset(self):
+        """Reset menu state so the same instance can be shown again."""
+        self.selected_mode = config.DEFAULT_GAME_MODE
+        self.running = True
     
     def run(self):
-        clock = pygame.time.Clock()
         self.running = True
         
+        # Full redraw on the first frame and whenever the selected mode changes,
+        # otherwise only buttons whose hover state flipped are pushed to the display
+        buttons = list(self.mode_buttons.values()) + [self.start_button]
+        drawn_mode = None
+        drawn_hover = None
+        
+        # Hover is tracked from MOUSEMOTION events; start from the current cursor position
+        mouse_pos = pygame.mouse.get_pos()
+        mouse_moved = True
+        
         while self.running:
-            # Get mouse position and reset click state
-            mouse_pos = pygame.mouse.get_pos()
+            # Reset click state
             mouse_clicked = False
             
+            # Block until an event arrives (or 16 ms pass) instead of spinning, then drain the rest
+            events = [pygame.event.wait(16)] + pygame.event.get()
+            
             # Process events
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     return None  # Exit game
+                if event.type == pygame.MOUSEMOTION:
+                    mouse_pos = event.pos
+                    mouse_moved = True
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Left click
+                        mouse_pos = event.pos
                         mouse_clicked = True
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         return None  # Exit to main menu
             
+            # Nothing to do until the mouse moves or clicks
+            if not (mouse_moved or mouse_clicked):
+                continue
+            mouse_moved = False
+            
             # Handle button hovers and clicks
             for mode_key, button in self.mode_buttons.items():
-                button.check_hover(mouse_pos)
-                if button.is_clicked(mouse_pos, mouse_clicked):
+                if button.handle(mouse_pos, mouse_clicked):
                     self.selected_mode = mode_key
                     print(f"Selected mode: {mode_key}")
             
             # Check if start button is clicked
-            self.start_button.check_hover(mouse_pos)
-            if self.start_button.is_clicked(mouse_pos, mouse_clicked):
+            if self.start_button.handle(mouse_pos, mouse_clicked):
                 self.running = False
                 print(f"Starting game with mode: {self.selected_mode}")
                 return self.selected_mode  # Return selected game mode
             
-            # Draw menu
-            self.draw()
-            
-            pygame.display.flip()
-            clock.tick(60)
+            # Draw menu only when something visible changed
+            hover = [button.is_hovered for button in buttons]
+            if self.selected_mode != drawn_mode:
+                self.draw()
+                pygame.display.flip()
+            elif hover != drawn_hover:
+                self.draw()
+                pygame.display.update([button.rect for button, was, now in zip(buttons, drawn_hover, hover) if was != now])
+            drawn_mode = self.selected_mode
+            drawn_hover = hover
             
         return self.selected_mode
     
     def draw(self):
-        # Fill background
-        self.screen.fill(self.bg_color)
-        
-        # Draw title
-        font_title = pygame.font.SysFont(None, 60)
-        title_text = font_title.render("Hand Gesture Car Control", True, self.title_color)
-        title_rect = title_text.get_rect(center=(self.screen_width//2, 100))
-        self.screen.blit(title_text, title_rect)
-        
-        # Draw subtitle
-        font_subtitle = pygame.font.SysFont(None, 36)
-        subtitle_text = font_subtitle.render("Select Game Mode", True, self.title_color)
-        subtitle_rect = subtitle_text.get_rect(center=(self.screen_width//2, 150))
-        self.screen.blit(subtitle_text, subtitle_rect)
-        
-        # Draw mode buttons
+        # Background, title, subtitle and buttons in their normal state
+        self.screen.blit(self._bg_cache, (0, 0))
+        
+        # Redraw only the mode buttons that look different from the cached state
         for mode_key, button in self.mode_buttons.items():
+            if mode_key != self.selected_mode and not button.is_hovered:
+                continue
+            
             # Highlight selected mode button
             original_color = button.color
             if mode_key == self.selected_mode:
@@ -161,14 +177,8 @@ class MainMenu:
             button.color = original_color
         
         # Draw description of selected mode
-        mode_info = config.GAME_MODES[self.selected_mode]
-        font_desc = pygame.font.SysFont(None, 30)
-        desc_text = font_desc.render(mode_info['description'], True, self.description_color)
-        desc_rect = desc_text.get_rect(center=(self.screen_width//2, 450))
+        desc_text, desc_rect = self._desc_texts[self.selected_mode]
         self.screen.blit(desc_text, desc_rect)
         
         # Ensure start button is drawn
         self.start_button.draw(self.screen)
-        
-        # Debug output - add this to check if the button is being created
-        print(f"Start button position: {self.start_button.rect}")
\ No newline at end of file
@@ -45,4 +45,9 @@ GAME_MODES = {
 }
 
 # Default game mode
-DEFAULT_GAME_MODE = 'normal'
\ No newline at end of file
+DEFAULT_GAME_MODE = 'normal'
+
+# Show the OpenCV window with the processed camera frame (hand landmarks and controls).
+# Set to False to skip the debug window entirely. It is drawn on a worker thread,
+# except on macOS where OpenCV windows must stay on the main thread.
+SHOW_DEBUG_WINDOW = True
@@ -3,6 +3,28 @@
 import pygame
 import math
 
+class Controls:
+    """Normalized car controls, read by attribute instead of dict lookups every frame."""
+    __slots__ = ('direction', 'speed', 'boost', 'braking')
+    
+    def __init__(self, direction=0.0, speed=0.5, boost=False, braking=False):
+        self.direction = direction
+        self.speed = speed
+        self.boost = boost
+        self.braking = braking
+    
+    @classmethod
+    def from_dict(cls, raw, max_speed=1.0):
+        """Build controls from a detector dict, mapping throttle/steering when speed/direction are missing."""
+        speed = raw.get('speed')
+        if speed is None:
+            throttle = raw.get('throttle')
+            speed = throttle * max_speed if throttle is not None else 0.5
+        direction = raw.get('direction')
+        if direction is None:
+            direction = raw.get('steering', 0)
+        return cls(direction, speed, raw.get('boost', False), raw.get('braking', False))
+
 class Car:
     def __init__(self, x, y):
         # Position and movement properties
@@ -38,16 +60,12 @@ class Car:
         self.speed_smoothing = 0.7      # החלקת מהירות חזקה יותר
         
     def update(self, controls):
-        """Update car state based on controls from hand gestures."""
+        """Update car state based on controls from hand gestures (a Controls or a raw dict)."""
         # בדוק ומפה את המפתחות שחסרים
-        if 'speed' not in controls and 'throttle' in controls:
-            controls['speed'] = controls['throttle'] * self.max_speed
+        if not isinstance(controls, Controls):
+            controls = Controls.from_dict(controls, self.max_speed)
         
-        if 'direction' not in controls and 'steering' in controls:
-            controls['direction'] = controls['steering']
-            
-        # Add default value for direction if not present
-        target_direction = controls.get('direction', 0)  # Default to 0 if 'direction' is missing
+        target_direction = controls.direction
         
         # Store current time
         current_time = pygame.time.get_ticks() / 1000  # Convert to seconds
@@ -58,7 +76,7 @@ class Car:
         self.direction += direction_change
         
         # Handle boosting (boost lasts for 1 second)
-        if controls['boost'] and not self.braking:
+        if controls.boost and not self.braking:
             if not self.boosting:
                 self.boosting = True
                 self.boost_start_time = current_time
@@ -72,7 +90,7 @@ class Car:
                 self.boosting = False
                 
         # Handle braking
-        elif controls['braking'] and not self.boosting:
+        elif controls.braking and not self.boosting:
             if not self.braking:
                 self.braking = True
                 self.brake_start_time = current_time
@@ -94,7 +112,7 @@ class Car:
         # Regular driving (not boosting or braking)
         elif not self.boosting and not self.braking:
             # Target speed from controls
-            self.target_speed = controls['speed']
+            self.target_speed = controls.speed
             
             # Apply smooth acceleration/deceleration with improved responsiveness
             if self.target_speed > self.speed:
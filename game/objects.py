@@ -3,6 +3,7 @@
 import pygame
 import random
 import math
+import numpy as np
 
 class RoadObject:
     def __init__(self, x, y, size, color, object_type=0, speed_multiplier=1.0, use_effects=True):
@@ -21,6 +22,10 @@ class RoadObject:
         # Move object down the road relative to car speed
         self.y += car_speed * 2 * self.speed_multiplier
         
+        self.animate()
+    
+    def animate(self):
+        """Advance the per-frame animation (position is handled separately)."""
         # Animate rotation for more visual interest
         self.angle = (self.angle + 2) % 360
     
@@ -103,6 +108,9 @@ class RoadObject:
         )
 
 class PowerUp(RoadObject):
+    # 'x2' label shared by all point multipliers, rendered on first use
+    _x2_label = None
+    
     def __init__(self, x, y, power_type, use_effects=True):
         # Power types: 0=boost, 1=shield, 2=point multiplier
         super().__init__(x, y, 15, self.get_color_for_type(power_type), 0, 1.0, use_effects)
@@ -119,9 +127,9 @@ class PowerUp(RoadObject):
         else:  # Point multiplier
             return (255, 215, 0)  # Gold
     
-    def update(self, car_speed):
-        """Update power-up position and animation."""
-        super().update(car_speed)
+    def animate(self):
+        """Advance rotation and pulsing animation."""
+        super().animate()
         
         # Pulsing animation
         self.pulse_factor += 0.05 * self.pulse_direction
@@ -189,14 +197,24 @@ class PowerUp(RoadObject):
                               (int(self.x), int(self.y)), self.size // 2, 2)
             
         else:  # Point multiplier - 'x2'
-            font = pygame.font.SysFont(None, 16)
-            text = font.render('x2', True, (255, 255, 255))
-            text_rect = text.get_rect(center=(self.x, self.y))
-            screen.blit(text, text_rect)
+            if PowerUp._x2_label is None:
+                PowerUp._x2_label = pygame.font.SysFont(None, 16).render('x2', True, (255, 255, 255))
+            text_rect = PowerUp._x2_label.get_rect(center=(self.x, self.y))
+            screen.blit(PowerUp._x2_label, text_rect)
 
 class RoadObjectManager:
     def __init__(self, obstacle_frequency=0.02, speed_multiplier=1.0, use_effects=True):
         self.objects = []
+        
+        # Positions, sizes and speeds of self.objects kept as parallel arrays
+        # so movement and collision tests run as vectorized operations.
+        # float64 keeps accumulated positions identical to per-object Python floats
+        self.xs = np.empty(0, dtype=np.float64)
+        self.ys = np.empty(0, dtype=np.float64)
+        self.sizes = np.empty(0, dtype=np.float64)
+        self.speed_multipliers = np.empty(0, dtype=np.float64)
+        self.passed = np.empty(0, dtype=bool)
+        
         self.obstacle_frequency = obstacle_frequency
         self.speed_multiplier = speed_multiplier
         self.power_up_chance = 0.3  # 30% chance of power-up instead of obstacle
@@ -236,6 +254,15 @@ class RoadObjectManager:
         for obj in self.objects:
             obj.use_effects = enabled
     
+    def _add_object(self, obj):
+        """Add an object to the list and its values to the parallel arrays."""
+        self.objects.append(obj)
+        self.xs = np.append(self.xs, float(obj.x))
+        self.ys = np.append(self.ys, float(obj.y))
+        self.sizes = np.append(self.sizes, float(obj.size))
+        self.speed_multipliers = np.append(self.speed_multipliers, float(obj.speed_multiplier))
+        self.passed = np.append(self.passed, obj.passed)
+    
     def update(self, car):
         """Update all road objects and check for collisions."""
         current_time = pygame.time.get_ticks() / 1000  # Current time in seconds
@@ -254,7 +281,7 @@ class RoadObjectManager:
                 # Create a power-up
                 x_pos = random.randint(320, 480)  # Random position on road
                 power_type = random.randint(0, 2)  # Random power-up type
-                self.objects.append(PowerUp(x_pos, -20, power_type, self.use_effects))
+                self._add_object(PowerUp(x_pos, -20, power_type, self.use_effects))
             else:
                 # Create a regular obstacle
                 object_type = random.randint(0, 2)
@@ -267,32 +294,56 @@ class RoadObjectManager:
                 )
                 size = random.randint(15, 25)
                 
-                self.objects.append(RoadObject(
+                self._add_object(RoadObject(
                     x_pos, y_pos, size, color, object_type, 
                     self.speed_multiplier, self.use_effects
                 ))
             
             self.last_spawn_time = current_time
         
-        # Update position of all objects and check for collisions/passes
-        for obj in self.objects[:]:  # Use a copy of the list for safe modification
-            obj.update(car.speed)
-            
-            # Check for collision with the car
-            if car.collide_with(obj.get_rect()):
-                # Handle collision
-                collision_occurred = True
-                self.objects.remove(obj)
-                continue
-            
-            # Check if car has passed the object
-            if not obj.passed and obj.y > car.y + car.height:
-                obj.passed = True
-                objects_passed += 1
-            
-          # Remove objects that exit the screen
-            if obj.y > 650:
-                self.objects.remove(obj)
+        if not self.objects:
+            return collision_occurred, objects_passed
+        
+        # Move all objects down the road relative to car speed
+        self.ys += car.speed * 2 * self.speed_multipliers
+        
+        # Copy positions back to the objects for drawing and advance their animation
+        for obj, y in zip(self.objects, self.ys.tolist()):
+            obj.y = y
+            obj.animate()
+        
+        # Broad phase: vectorized bounding box overlap with the car
+        # (1 pixel margin because pygame.Rect truncates to integers)
+        car_rect = car.get_rect()
+        near = ((self.xs - self.sizes < car_rect.right + 1) &
+                (self.xs + self.sizes > car_rect.left - 1) &
+                (self.ys - self.sizes < car_rect.bottom + 1) &
+                (self.ys + self.sizes > car_rect.top - 1))
+        
+        # Narrow phase: exact check, which also triggers the car's collision feedback
+        hit = np.zeros(len(self.objects), dtype=bool)
+        for i in np.flatnonzero(near).tolist():
+            if car.collide_with(self.objects[i].get_rect()):
+                hit[i] = True
+        collision_occurred = bool(hit.any())
+        
+        # Check if car has passed objects
+        newly_passed = ~hit & ~self.passed & (self.ys > car.y + car.height)
+        if newly_passed.any():
+            self.passed |= newly_passed
+            objects_passed = int(newly_passed.sum())
+            for i in np.flatnonzero(newly_passed).tolist():
+                self.objects[i].passed = True
+        
+        # Remove collided objects and objects that exit the screen
+        keep = ~hit & (self.ys <= 650)
+        if not keep.all():
+            self.objects = [obj for obj, k in zip(self.objects, keep.tolist()) if k]
+            self.xs = self.xs[keep]
+            self.ys = self.ys[keep]
+            self.sizes = self.sizes[keep]
+            self.speed_multipliers = self.speed_multipliers[keep]
+            self.passed = self.passed[keep]
         
         return collision_occurred, objects_passed
         
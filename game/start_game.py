@@ -58,7 +58,7 @@ class HandGestureCarGame:
             return False
         
         # Select camera
-        self.selected_camera = select_camera(available_cameras)
+        self.selected_camera = select_camera(available_cameras, self.screen)
         if self.selected_camera is None:
             self.show_error("No camera selected", "You must select a camera to continue.")
             return False
@@ -121,7 +121,6 @@ class HandGestureCarGame:
             return
         
         self.show_loading_message("Ready to play!")
-        time.sleep(1)  # Brief delay to show ready message
         
         # Main application loop
         running = True
@@ -345,6 +344,7 @@ class HandGestureCarGame:
                     sys.exit()
                 if event.type == pygame.KEYDOWN:
                     waiting = False
+            self.clock.tick(30)  # Reuse the game clock instead of spinning
     
     def show_loading_message(self, message):
         """Display a loading message."""
@@ -401,6 +401,7 @@ class HandGestureCarGame:
                         sys.exit()
                     if event.type == pygame.KEYDOWN:
                         waiting = False
+                self.clock.tick(30)
                         
             return False  # Error occurred
         except Exception as e:
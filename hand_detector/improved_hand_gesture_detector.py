@@ -7,12 +7,17 @@ class EnhancedHandGestureDetector:
     
     def __init__(self):
         """Initialize the hand gesture detector with MediaPipe."""
+        # In video mode MediaPipe only re-runs the expensive palm detector when landmark
+        # tracking confidence drops below this threshold; otherwise the hand ROI is derived
+        # from the previous frame's landmarks and only the landmark model runs.
+        self._tracking_conf_threshold = 0.5
+        
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
+            static_image_mode=False,  # Must stay False so palm detection is skipped while tracking
             max_num_hands=1,  # Track only one hand for simplicity
             min_detection_confidence=0.6,  # Increased from 0.4 for more reliable detection
-            min_tracking_confidence=0.5    # Increased from 0.4 for better tracking
+            min_tracking_confidence=self._tracking_conf_threshold  # Increased from 0.4 for better tracking
         )
         self.mp_draw = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
@@ -33,22 +38,25 @@ class EnhancedHandGestureDetector:
         # Debug and display options
         self.debug_mode = True
         
-    def detect_gestures(self, frame):
+    def detect_gestures(self, frame, rgb_frame=None):
         """
         Detect hand gestures in the given frame and return control signals.
         
         Args:
             frame: CV2 image frame
+            rgb_frame: Optional RGB copy of frame; converted here if not given
             
         Returns:
             controls: Dictionary with control values (steering, throttle, braking, boost)
             processed_frame: Frame with visualization of detected hands and controls
         """
         try:
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Convert BGR to RGB unless the caller already did
+            if rgb_frame is None:
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             
-            # Process the frame with MediaPipe
+            # Process the frame with MediaPipe (read-only lets it skip copying the image)
+            rgb_frame.flags.writeable = False
             results = self.hands.process(rgb_frame)
             
             # Default controls
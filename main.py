@@ -1,19 +1,20 @@
 # main.py - Main entry point for the Hand Gesture Car Control application
 
 import cv2
-import numpy as np
 import pygame
-import os
 import time
 import sys
+import threading
+import queue
+import logging
 from pygame.locals import *
 
 # Import our application modules
 import config
 from main_menu import MainMenu
 from hand_detector.improved_hand_gesture_detector import EnhancedHandGestureDetector  # Make sure this path is correct
-from utils.camera import find_available_cameras, select_camera
-from game.car import Car
+from utils.camera import find_available_cameras, select_camera, ThreadedCamera
+from game.car import Car, Controls
 from game.objects import RoadObjectManager
 from utils.sound import SoundManager
 from utils.ui import GameUI
@@ -27,6 +28,10 @@ from debug_utils import MovementDebugger
 # Add these constants at the beginning of the file after imports
 MOVEMENT_THRESHOLD = 30  # Minimum movement distance to register as a movement
 GESTURE_COOLDOWN = 15    # Frames to wait before detecting another gesture
+DETECTION_FRAME_WIDTH = 640  # Larger camera frames are scaled down to this width before detection
+GAME_EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN)  # Events handled during gameplay
+
+logger = logging.getLogger(__name__)
 
 class HandGestureCarControl:
     def __init__(self):
@@ -35,9 +40,38 @@ class HandGestureCarControl:
         
         # Setup display
         self.screen_width, self.screen_height = 800, 600
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        try:
+            # Let the driver pace frames with vsync (needs SCALED or OPENGL)
+            self.screen = pygame.display.set_mode(
+                (self.screen_width, self.screen_height), pygame.SCALED, vsync=1
+            )
+        except pygame.error:
+            # vsync not available on this system
+            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
         pygame.display.set_caption("Hand Gesture Car Control")
         
+        # Pre-render the static game background (white field + road) in the display pixel format
+        self._bg = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self._bg.fill((255, 255, 255))  # White background
+        pygame.draw.rect(self._bg, (200, 200, 200), (300, 0, 200, 600))  # Road
+        
+        # Semi-transparent overlays for the pause and game over screens never change
+        self._pause_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        self._pause_overlay.fill((0, 0, 0, 128))  # Semi-transparent black
+        self._pause_overlay = self._pause_overlay.convert_alpha()
+        self._gameover_overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
+        self._gameover_overlay.fill((0, 0, 0, 192))  # More opaque black
+        self._gameover_overlay = self._gameover_overlay.convert_alpha()
+        
+        # Fonts are looked up once and reused by every screen
+        self._fonts = {size: pygame.font.SysFont(None, size) for size in (30, 36, 48, 60, 72)}
+        
+        # Cache of pre-rendered static text surfaces, keyed by (text, size, color)
+        self._static_text = {}
+        
+        # Area of the last loading message, so later messages only update that region
+        self._loading_rect = None
+        
         # Initialize camera
         self.cap = None
         self.init_camera()
@@ -57,17 +91,48 @@ class HandGestureCarControl:
         self.show_loading_screen("Loading sounds...")
         self.sound_manager = SoundManager()
         
+        # Main menu is built once and reset on every return to it
+        self.menu = MainMenu(self.screen)
+        
         # Default game state
         self.game_mode = config.DEFAULT_GAME_MODE
         self.game_active = False
         self.paused = False
+        self._pause_drawn = False  # Pause overlay only needs drawing once per pause
         
         # Frame skipping for performance
         self.frame_skip = 0
         self.max_frame_skip = 0  # 0 means process every frame, increase for better performance
         
+        # Controls used on frames where the detector doesn't run
+        self._default_controls = Controls(direction=0.0, speed=0.5)
+        
+        # Hand detection runs on a background thread so it never blocks rendering.
+        # The latest result is published as (seq, controls, stable_command, processed_frame).
+        self._detect_lock = threading.Lock()
+        self._detect_output = None
+        self._last_detect_seq = 0
+        self._camera_lost = False
+        self._detect_running = True
+        self._detect_thread = threading.Thread(target=self._detect_loop, daemon=True)
+        self._detect_thread.start()
+        
+        # OpenCV debug window is drawn on its own thread from a one-slot queue.
+        # HighGUI only works on the main thread on macOS, so there frames are shown inline instead.
+        self._cv_escape = False  # Set when ESC is pressed in the debug window
+        self._cv_queue = queue.Queue(maxsize=1)
+        self._cv_running = config.SHOW_DEBUG_WINDOW
+        self._cv_inline = self._cv_running and sys.platform == 'darwin'
+        self._cv_thread = None
+        if self._cv_running and not self._cv_inline:
+            self._cv_thread = threading.Thread(target=self._debug_window_loop, daemon=True)
+            self._cv_thread.start()
+        
+        # Last connectivity check as (timestamp, result) so repeated diagnostics don't re-block
+        self._last_connectivity = (0.0, None)
+        self.connectivity_cache_seconds = 30
+        
         self.show_loading_screen("Ready to play!")
-        time.sleep(1)  # Show ready message briefly
     
     def init_camera(self):
         """Initialize the camera capture using camera selection interface."""
@@ -82,8 +147,8 @@ class HandGestureCarControl:
             pygame.quit()
             sys.exit(1)
         
-        # Let user select a camera
-        selected_camera = select_camera(available_cameras)
+        # Let user select a camera, drawing on our window so the display isn't recreated
+        selected_camera = select_camera(available_cameras, self.screen)
         if selected_camera is None:
             message = "No camera selected. Exiting."
             print(message)
@@ -94,11 +159,7 @@ class HandGestureCarControl:
         self.selected_camera = selected_camera
         
         # Initialize the selected camera with lower resolution for better performance
-        self.cap = cv2.VideoCapture(selected_camera)
-        
-        # Set camera properties for more reliable operation
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)  
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480) 
+        self.cap = self._open_camera()
         
         if not self.cap.isOpened():
             message = f"Failed to open camera {selected_camera}. Please try another camera."
@@ -108,6 +169,31 @@ class HandGestureCarControl:
             sys.exit(1)
         
         print(f"Using camera index {selected_camera}")
+    
+    def _open_camera(self):
+        """Open the selected camera with capture running on its own thread."""
+        return ThreadedCamera(
+            self.selected_camera,
+            width=640,
+            height=480,
+            transform_fn=self._preprocess_frame
+        )
+    
+    @staticmethod
+    def _preprocess_frame(frame):
+        """Mirror a camera frame and make the RGB copy MediaPipe needs (runs on the capture thread).
+        
+        Returns:
+            tuple: (mirrored BGR frame for display, mirrored RGB frame for detection)
+        """
+        # Cameras that ignore the requested resolution still get downscaled before inference
+        h, w = frame.shape[:2]
+        if w > DETECTION_FRAME_WIDTH:
+            size = (DETECTION_FRAME_WIDTH, h * DETECTION_FRAME_WIDTH // w)
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        
+        frame = cv2.flip(frame, 1)
+        return frame, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
     def run(self):
         """Main application loop."""
@@ -115,8 +201,10 @@ class HandGestureCarControl:
         while running:
             # Show main menu if game is not active
             if not self.game_active:
-                menu = MainMenu(self.screen)
-                selected_mode = menu.run()
+                # Menus may track the mouse, gameplay blocks its motion events
+                pygame.event.set_allowed(pygame.MOUSEMOTION)
+                self.menu.reset()
+                selected_mode = self.menu.run()
                 
                 if selected_mode is None:
                     running = False  # Exit if menu was closed
@@ -159,6 +247,14 @@ class HandGestureCarControl:
         # Reset sound
         self.sound_manager.reset()
         
+        # Drop any detection result left over from a previous game
+        with self._detect_lock:
+            self._detect_output = None
+        self._cv_escape = False
+        
+        # Mouse hover isn't needed during gameplay
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+        
         # Initialize clock for FPS control
         self.clock = pygame.time.Clock()
     
@@ -172,8 +268,11 @@ class HandGestureCarControl:
         # Initialize the debugger
         movement_debugger = MovementDebugger()
 
-        # Process events
-        for event in pygame.event.get():
+        # Process only the events the game handles, then drop the rest without dispatching them.
+        # Clear without pumping so input arriving after the get isn't discarded unseen
+        events = pygame.event.get(GAME_EVENT_TYPES)
+        pygame.event.clear(pump=False)
+        for event in events:
             if event.type == pygame.QUIT:
                 return False  # Exit the application
             
@@ -181,6 +280,7 @@ class HandGestureCarControl:
                 if event.key == pygame.K_ESCAPE:
                     # Toggle pause
                     self.paused = not self.paused
+                    self._pause_drawn = False
                 
                 if event.key == pygame.K_q and self.paused:
                     # Quit to main menu if paused
@@ -194,7 +294,7 @@ class HandGestureCarControl:
                     if self.game_ui.check_mute_button_click(event.pos):
                         # Update sound manager's mute state to match UI
                         self.sound_manager.set_mute(self.game_ui.sound_muted)
-                        print(f"Sound state changed in run_game: {'MUTED' if self.game_ui.sound_muted else 'UNMUTED'}")
+                        logger.debug("Sound state changed in run_game: %s", 'MUTED' if self.game_ui.sound_muted else 'UNMUTED')
                         # Force sound update after mute state change
                         self.sound_manager.update_engine_sound(
                             self.car.speed, 
@@ -202,11 +302,15 @@ class HandGestureCarControl:
                             False   # Not boosting
                         )
         
-        # If paused, show pause menu and don't update game state
+        # If paused, show pause menu and don't update game state.
+        # The detection thread idles and pauses camera capture, so no reads, transforms or inference happen here.
         if self.paused:
-            self.draw_pause_menu()
-            pygame.display.flip()
-            self.clock.tick(60)
+            # The overlay darkens the whole frame, so push it once; after that nothing changes
+            if not self._pause_drawn:
+                self.draw_pause_menu()
+                pygame.display.flip()
+                self._pause_drawn = True
+            self.clock.tick(30)  # Static overlay, no need for 60 FPS
             return True
         
         # Update game time
@@ -218,66 +322,36 @@ class HandGestureCarControl:
             self.game_over("Time Up!")
             return True
         
-        # Process hand detection with frame skipping
-        controls = {'steering': 0.0, 'throttle': 0.0}  # Default controls
+        # Camera failed and could not be reopened by the detection thread
+        if self._camera_lost:
+            logger.warning("Cannot reopen camera, returning to menu...")
+            self._camera_lost = False
+            self.game_active = False
+            return True
         
-        if self.frame_skip <= 0:
-            # Process frame only if not skipping
-            ret, frame = self.cap.read()
-            if not ret:
-                print("Error reading frame from camera, trying again...")
-                # Try to reinitialize the camera
-                self.cap.release()
-                time.sleep(1.0)  # Wait a bit longer
-                self.cap = cv2.VideoCapture(self.selected_camera)
-                
-                # Re-apply camera settings
-                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-                
-                if not self.cap.isOpened():
-                    print("Cannot reopen camera, returning to menu...")
-                    self.game_active = False
-                    return True
-                return True  # Continue trying next frame
-            
-            # Flip the image horizontally to act as a mirror
-            frame = cv2.flip(frame, 1)
+        # Read the freshest detection result published by the detection thread
+        controls = None
+        with self._detect_lock:
+            detect_output = self._detect_output
+        
+        if detect_output is not None:
+            seq, controls, stable_command, processed_frame = detect_output
             
-            try:
-                # Process hand gestures with improved detection
-                controls, processed_frame = self.hand_detector.detect_gestures(frame)
-                
-                # Get a stable command (helps reduce jitter)
-                stable_command = self.hand_detector.get_stable_command()
+            # Only act on results we haven't seen yet
+            if seq != self._last_detect_seq:
+                self._last_detect_seq = seq
                 
                 if stable_command:
                     # Send the command to the car with improved command handling
                     command_sent = self.car_controller.send_command(stable_command)
-                    print(f"Command sent to car: {stable_command}, Success: {command_sent}")
+                    logger.debug("Command sent to car: %s, Success: %s", stable_command, command_sent)
                 
                 # Display hand detection frame
-                cv2.imshow("Hand Gesture Detection", processed_frame)
-            except Exception as e:
-                print(f"Error in hand gesture detection: {e}")
-                cv2.imshow("Hand Gesture Detection", frame)  # Show original frame on error
-            
-            # Reset frame skip counter
-            self.frame_skip = self.max_frame_skip
-        else:
-            # Skip frame processing but decrement counter
-            self.frame_skip -= 1
-        
-        # Ensure controls contains all necessary keys for game mechanics
-        if 'speed' not in controls and 'throttle' in controls:
-            controls['speed'] = controls['throttle']  # Map throttle to speed for car update
-        elif 'speed' not in controls:
-            controls['speed'] = 0.5  # Default speed
-        
-        if 'direction' not in controls and 'steering' in controls:
-            controls['direction'] = controls['steering']  # Map steering to direction for car update
-        elif 'direction' not in controls:
-            controls['direction'] = 0  # Default direction
+                self._show_debug_frame(processed_frame)
+        
+        # Detector output is normalized on the detection thread; fall back to defaults otherwise
+        if controls is None:
+            controls = self._default_controls
 
         # Update car with controls
         self.car.update(controls)
@@ -296,31 +370,127 @@ class HandGestureCarControl:
         # Update sound - make sure mute state is respected
         self.sound_manager.update_engine_sound(
             self.car.speed, 
-            controls.get('braking', False), 
-            controls.get('boost', False)
+            controls.braking, 
+            controls.boost
         )
         
         # Draw game
         self.draw_game()
         
         # Exit if ESC key is pressed in the OpenCV window
-        if cv2.waitKey(1) == 27:
+        if self._cv_escape:
+            self._cv_escape = False
             self.game_active = False
             return True
             
-        # Limit to 60 FPS
+        # Limit to 60 FPS - still needed with vsync since car and object movement are per frame
         self.clock.tick(60)
         
         return True  # Continue the game loop
         
+    def _detect_loop(self):
+        """Background worker: read camera frames and run hand detection."""
+        seq = 0
+        capture_paused = False
+        while self._detect_running:
+            # Nothing to detect while in the menu or paused, so stop the capture thread too
+            if not self.game_active or self.paused or self._camera_lost:
+                if not capture_paused:
+                    self.cap.pause()
+                    capture_paused = True
+                time.sleep(0.01)
+                continue
+            if capture_paused:
+                self.cap.resume()
+                capture_paused = False
+            
+            ret, frames = self.cap.read()
+            if not ret:
+                if not self._detect_running:
+                    break
+                logger.warning("Error reading frame from camera, trying again...")
+                # Try to reinitialize the camera
+                self.cap.release()
+                time.sleep(1.0)  # Wait a bit longer
+                
+                # cleanup() may have run during the sleep; don't open a camera nobody will release
+                if not self._detect_running:
+                    break
+                cap = self._open_camera()
+                if not self._detect_running:
+                    cap.release()
+                    break
+                self.cap = cap
+                
+                if not self.cap.isOpened():
+                    self._camera_lost = True
+                continue  # Continue trying next frame
+            
+            # Frame skipping for performance
+            if self.frame_skip > 0:
+                self.frame_skip -= 1
+                continue
+            self.frame_skip = self.max_frame_skip
+            
+            # Already mirrored and converted to RGB on the capture thread
+            frame, rgb_frame = frames
+            
+            try:
+                # Process hand gestures with improved detection
+                raw_controls, processed_frame = self.hand_detector.detect_gestures(frame, rgb_frame)
+                controls = Controls.from_dict(raw_controls)
+                
+                # Get a stable command (helps reduce jitter)
+                stable_command = self.hand_detector.get_stable_command()
+            except Exception as e:
+                logger.error("Error in hand gesture detection: %s", e)
+                controls, stable_command, processed_frame = None, None, frame  # Show original frame on error
+            
+            seq += 1
+            with self._detect_lock:
+                self._detect_output = (seq, controls, stable_command, processed_frame)
+    
+    def _show_debug_frame(self, frame):
+        """Hand a processed frame to the debug window thread, replacing any frame not yet shown."""
+        if not self._cv_running:
+            return
+        if self._cv_inline:
+            cv2.imshow("Hand Gesture Detection", frame)
+            if cv2.waitKey(1) == 27:
+                self._cv_escape = True
+            return
+        try:
+            self._cv_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._cv_queue.put_nowait(frame)
+        except queue.Full:
+            pass
+    
+    def _debug_window_loop(self):
+        """Background worker: show processed frames in the OpenCV debug window."""
+        window_shown = False
+        while self._cv_running:
+            try:
+                frame = self._cv_queue.get(timeout=0.05)
+                cv2.imshow("Hand Gesture Detection", frame)
+                window_shown = True
+            except queue.Empty:
+                pass
+            
+            # waitKey has to run on the same thread as imshow to keep the window responsive;
+            # there's nothing to service until the first frame has created the window
+            if window_shown and cv2.waitKey(1) == 27:
+                self._cv_escape = True
+        
+        if window_shown:
+            cv2.destroyAllWindows()
+    
     def draw_game(self):
         """Draw the game screen."""
-        # Clear screen
-        self.screen.fill((255, 255, 255))  # White background
-        
-        # Draw road
-        road_color = (200, 200, 200)
-        pygame.draw.rect(self.screen, road_color, (300, 0, 200, 600))
+        # Clear screen and draw road from the pre-rendered background
+        self.screen.blit(self._bg, (0, 0))
         
         # Draw road objects
         self.road_objects.draw(self.screen)
@@ -343,49 +513,48 @@ class HandGestureCarControl:
     def draw_pause_menu(self):
         """Draw the pause menu overlay."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))  # Semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._pause_overlay, (0, 0))
         
         # Pause title
-        font_title = pygame.font.SysFont(None, 60)
-        title_text = font_title.render("PAUSED", True, (255, 255, 255))
+        title_text = self._render_static("PAUSED", 60, (255, 255, 255))
         title_rect = title_text.get_rect(center=(400, 200))
         self.screen.blit(title_text, title_rect)
         
         # Instructions
-        font_instructions = pygame.font.SysFont(None, 36)
-        
-        resume_text = font_instructions.render("Press ESC to Resume", True, (255, 255, 255))
+        resume_text = self._render_static("Press ESC to Resume", 36, (255, 255, 255))
         resume_rect = resume_text.get_rect(center=(400, 300))
         self.screen.blit(resume_text, resume_rect)
         
-        quit_text = font_instructions.render("Press Q to Quit to Menu", True, (255, 255, 255))
+        quit_text = self._render_static("Press Q to Quit to Menu", 36, (255, 255, 255))
         quit_rect = quit_text.get_rect(center=(400, 350))
         self.screen.blit(quit_text, quit_rect)
     
+    def _render_static(self, text, size, color):
+        """Render text that never changes once and reuse the converted surface."""
+        key = (text, size, color)
+        surf = self._static_text.get(key)
+        if surf is None:
+            surf = self._fonts[size].render(text, True, color).convert_alpha()
+            self._static_text[key] = surf
+        return surf
+    
     def game_over(self, reason="Game Over"):
         """Handle game over state."""
         # Display game over screen
-        overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 192))  # More opaque black
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._gameover_overlay, (0, 0))
         
         # Game over title
-        font_title = pygame.font.SysFont(None, 72)
-        title_text = font_title.render(reason, True, (255, 50, 50))
+        title_text = self._fonts[72].render(reason, True, (255, 50, 50))
         title_rect = title_text.get_rect(center=(400, 200))
         self.screen.blit(title_text, title_rect)
         
         # Final score
-        font_score = pygame.font.SysFont(None, 48)
-        score_text = font_score.render(f"Final Score: {int(self.score)}", True, (255, 255, 255))
+        score_text = self._fonts[48].render(f"Final Score: {int(self.score)}", True, (255, 255, 255))
         score_rect = score_text.get_rect(center=(400, 300))
         self.screen.blit(score_text, score_rect)
         
         # Continue instructions
-        font_continue = pygame.font.SysFont(None, 36)
-        continue_text = font_continue.render("Press any key to continue...", True, (200, 200, 200))
+        continue_text = self._render_static("Press any key to continue...", 36, (200, 200, 200))
         continue_rect = continue_text.get_rect(center=(400, 400))
         self.screen.blit(continue_text, continue_rect)
         
@@ -395,6 +564,7 @@ class HandGestureCarControl:
         self.sound_manager.play_game_over()
         
         # Wait for key press
+        clock = pygame.time.Clock()
         waiting = True
         while waiting:
             for event in pygame.event.get():
@@ -403,16 +573,47 @@ class HandGestureCarControl:
                     exit()
                 if event.type == pygame.KEYDOWN:
                     waiting = False
+            clock.tick(30)  # Don't spin the CPU while waiting
         
         # Return to menu
         self.game_active = False
     
     def cleanup(self):
         """Clean up resources before exit."""
-        if self.cap and self.cap.isOpened():
-            self.cap.release()
-        cv2.destroyAllWindows()
-        pygame.quit()
+        # Runs from both run() and __del__, only the first call does anything
+        if getattr(self, '_cleaned_up', False):
+            return
+        self._cleaned_up = True
+        
+        # Stop the detection thread before releasing the camera it reads from
+        self._detect_running = False
+        detect_thread = getattr(self, '_detect_thread', None)
+        if detect_thread is not None and detect_thread.is_alive():
+            detect_thread.join(timeout=1.0)
+        
+        # Stop the debug window thread; it closes its own window
+        self._cv_running = False
+        cv_thread = getattr(self, '_cv_thread', None)
+        if cv_thread is not None and cv_thread.is_alive():
+            cv_thread.join(timeout=1.0)
+        
+        # Releasing also stops the capture thread.
+        # Each step is guarded so a partially initialized instance can still clean up.
+        cap = getattr(self, 'cap', None)
+        if cap is not None:
+            try:
+                cap.release()
+            except Exception as e:
+                logger.warning("Error releasing camera: %s", e)
+            self.cap = None
+        try:
+            cv2.destroyAllWindows()
+        except Exception as e:
+            logger.warning("Error closing OpenCV windows: %s", e)
+        try:
+            pygame.quit()
+        except Exception as e:
+            logger.warning("Error shutting down pygame: %s", e)
     
     def show_loading_screen(self, message):
         """Display a loading screen with a message."""
@@ -421,60 +622,71 @@ class HandGestureCarControl:
             if not pygame.get_init() or not pygame.display.get_surface():
                 return
                 
-            self.screen.fill((240, 240, 255))  # Light blue background
-            # Draw title
-            font_title = pygame.font.SysFont(None, 60)
-            title_text = font_title.render("Hand Gesture Car Control", True, (20, 20, 100))
-            title_rect = title_text.get_rect(center=(self.screen_width//2, 200))
-            self.screen.blit(title_text, title_rect)
-            
-            # Draw loading message
-            font_message = pygame.font.SysFont(None, 36)
-            message_text = font_message.render(message, True, (50, 50, 150))
+            bg_color = (240, 240, 255)  # Light blue background
+            message_text = self._fonts[36].render(message, True, (50, 50, 150))
             message_rect = message_text.get_rect(center=(self.screen_width//2, 300))
-            self.screen.blit(message_text, message_rect)
             
-            pygame.display.flip()
+            if self._loading_rect is None:
+                # First draw: full screen with title
+                self.screen.fill(bg_color)
+                title_text = self._render_static("Hand Gesture Car Control", 60, (20, 20, 100))
+                title_rect = title_text.get_rect(center=(self.screen_width//2, 200))
+                self.screen.blit(title_text, title_rect)
+                self.screen.blit(message_text, message_rect)
+                pygame.display.flip()
+            else:
+                # Later draws: only replace the message
+                self.screen.fill(bg_color, self._loading_rect)
+                self.screen.blit(message_text, message_rect)
+                pygame.display.update(self._loading_rect.union(message_rect))
+            
+            self._loading_rect = message_rect
         except pygame.error as e:
             print(f"pygame error during loading screen: {e}")
     
     def show_error(self, title, message):
         """Display an error message."""
+        self._loading_rect = None  # Loading screen has to be redrawn in full after this
         self.screen.fill((255, 200, 200))  # Light red background
         
         # Draw error title
-        font_title = pygame.font.SysFont(None, 60)
-        title_text = font_title.render(title, True, (200, 0, 0))
+        title_text = self._fonts[60].render(title, True, (200, 0, 0))
         title_rect = title_text.get_rect(center=(self.screen_width//2, 200))
         self.screen.blit(title_text, title_rect)
         
         # Draw error message
-        font_message = pygame.font.SysFont(None, 36)
-        message_text = font_message.render(message, True, (100, 0, 0))
+        message_text = self._fonts[36].render(message, True, (100, 0, 0))
         message_rect = message_text.get_rect(center=(self.screen_width//2, 300))
         self.screen.blit(message_text, message_rect)
         
         # Draw exit instruction
-        font_exit = pygame.font.SysFont(None, 30)
-        exit_text = font_exit.render("Press any key to exit...", True, (100, 0, 0))
+        exit_text = self._render_static("Press any key to exit...", 30, (100, 0, 0))
         exit_rect = exit_text.get_rect(center=(self.screen_width//2, 400))
         self.screen.blit(exit_text, exit_rect)
         
         pygame.display.flip()
         
         # Wait for key press
+        clock = pygame.time.Clock()
         waiting = True
         while waiting:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT or event.type == pygame.KEYDOWN:
                     waiting = False
+            clock.tick(30)  # Don't spin the CPU while waiting
 
     def troubleshoot_connectivity(self):
         """Diagnose and fix connectivity issues with the car."""
+        import errno
         import socket
         import subprocess
         import platform
         
+        # Reuse a recent result instead of blocking on the network again
+        checked_at, cached_result = self._last_connectivity
+        if cached_result is not None and time.monotonic() - checked_at < self.connectivity_cache_seconds:
+            return cached_result
+        
         print("======= Connectivity Troubleshooting =======")
         
         # Check network configuration
@@ -494,18 +706,34 @@ class HandGestureCarControl:
             print("WARNING: Your computer appears to be on a different subnet than the car.")
             print("The car typically uses 192.168.4.x network.")
         
-        # Try to ping the car
         car_ip = "192.168.4.1"  # Default car IP
-        param = '-n' if platform.system().lower() == 'windows' else '-c'
-        command = ['ping', param, '1', car_ip]
         
+        # Quick reachability probe: a TCP connect that is accepted or refused means the host answered
+        probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        probe.settimeout(0.2)
         try:
-            output = subprocess.check_output(command).decode('utf-8')
-            print(f"Ping result: {output}")
-            ping_ok = "time=" in output or "time<" in output
-        except subprocess.CalledProcessError:
-            print(f"Failed to ping car at {car_ip}.")
+            result = probe.connect_ex((car_ip, 80))
+            ping_ok = result == 0 or result == errno.ECONNREFUSED
+        except OSError:
             ping_ok = False
+        finally:
+            probe.close()
+        
+        # Fall back to a short ping if the probe got no answer
+        if not ping_ok:
+            param = '-n' if platform.system().lower() == 'windows' else '-c'
+            command = ['ping', param, '1', car_ip]
+            
+            try:
+                completed = subprocess.run(command, timeout=0.5, capture_output=True)
+                output = completed.stdout.decode('utf-8', errors='replace')
+                print(f"Ping result: {output}")
+                ping_ok = completed.returncode == 0 and ("time=" in output or "time<" in output)
+            except (subprocess.TimeoutExpired, OSError):
+                ping_ok = False
+            
+            if not ping_ok:
+                print(f"Failed to ping car at {car_ip}.")
         
         # Provide recommendations based on results
         print("\n------- Recommendations -------")
@@ -517,15 +745,25 @@ class HandGestureCarControl:
             print("2. Verify the car's IP address")
             print("3. Restart the car's control system")
         
-        return network_ok and ping_ok
+        result = network_ok and ping_ok
+        self._last_connectivity = (time.monotonic(), result)
+        return result
 
     def __del__(self):
         """Clean up resources when the object is destroyed."""
-        if hasattr(self, 'cap') and self.cap is not None:
-            self.cap.release()
+        # Nothing left to do if cleanup() already ran (the normal exit path)
+        if getattr(self, '_cleaned_up', False):
+            return
+        
+        # May run during interpreter shutdown, when cv2/pygame are already torn down
+        try:
+            self.cleanup()
+        except Exception:
+            pass
 
 def main():
     """Main entry point for the application."""
+    logging.basicConfig(level=logging.INFO)
     try:
         # Create and run the game application
         app = HandGestureCarControl()
@@ -1,3 +1,7 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
 class Player:
     def __init__(self, x, y, width, height):
         self.x = x
@@ -10,6 +14,8 @@ class Player:
         self.is_jumping = False
         self.jump_count = 0
         self.max_jump = 15    # Maximum jump frames
+        # Per-frame upward movement for each jump frame, computed once
+        self._jump_dy = tuple(self.jump_speed - i * self.gravity for i in range(self.max_jump))
     
     def move_left(self):
         self.x -= self.move_speed
@@ -17,7 +23,7 @@ class Player:
         if self.x < 0:
             self.x = 0
         # Log movement for debugging
-        print(f"Moving left to: {self.x}")
+        logger.debug("Moving left to: %s", self.x)
     
     def move_right(self):
         self.x += self.move_speed
@@ -25,20 +31,20 @@ class Player:
         if self.x + self.width > 800:  # Adjust with your screen width
             self.x = 800 - self.width
         # Log movement for debugging
-        print(f"Moving right to: {self.x}")
+        logger.debug("Moving right to: %s", self.x)
     
     def jump(self):
         if not self.is_jumping:
             self.is_jumping = True
             self.jump_count = 0
             # Log jump for debugging
-            print("Jump initiated")
+            logger.debug("Jump initiated")
     
     def update(self):
         # Handle jumping physics
         if self.is_jumping:
             if self.jump_count < self.max_jump:
-                self.y -= self.jump_speed - (self.jump_count * self.gravity)
+                self.y -= self._jump_dy[self.jump_count]
                 self.jump_count += 1
             else:
                 self.is_jumping = False
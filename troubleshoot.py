@@ -1,9 +1,15 @@
+import select
 import socket
 import time
 import sys
 
-def test_car_connection(car_ip="192.168.4.1", car_port=100, test_commands=None):
-    """Test connection and command response with the car"""
+def test_car_connection(car_ip="192.168.4.1", car_port=100, test_commands=None, pace=0.0, ping_wait=0.2):
+    """Test connection and command response with the car.
+    
+    Commands are UDP datagrams, so they are sent back-to-back unless pace
+    (seconds between commands) is set, e.g. to watch the car execute each one.
+    Any replies arriving within ping_wait seconds after the last send are printed.
+    """
     if test_commands is None:
         test_commands = ["FORWARD", "LEFT", "RIGHT", "BACKWARD", "STOP"]
     
@@ -12,7 +18,7 @@ def test_car_connection(car_ip="192.168.4.1", car_port=100, test_commands=None):
     # Create socket
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.settimeout(1)  # 1 second timeout
+        sock.setblocking(False)  # Replies are collected with select()
         print("Socket created successfully")
     except socket.error as e:
         print(f"Socket creation failed: {e}")
@@ -24,10 +30,23 @@ def test_car_connection(car_ip="192.168.4.1", car_port=100, test_commands=None):
             print(f"Sending command: {cmd}")
             sock.sendto(cmd.encode(), (car_ip, car_port))
             print(f"Command {cmd} sent successfully")
-            time.sleep(1)  # Wait for car to execute command
+            if pace:
+                time.sleep(pace)  # Wait for car to execute command
         except Exception as e:
             print(f"Failed to send command {cmd}: {e}")
     
+    # Collect any acknowledgements until ping_wait passes without a reply
+    while ping_wait:
+        readable, _, _ = select.select([sock], [], [], ping_wait)
+        if not readable:
+            break
+        try:
+            data, addr = sock.recvfrom(1024)
+            print(f"Reply from {addr[0]}:{addr[1]}: {data!r}")
+        except OSError as e:
+            print(f"Error reading reply: {e}")
+            break
+    
     sock.close()
     print("Connection test completed")
     
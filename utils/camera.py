@@ -1,31 +1,69 @@
 # utils/camera.py - Camera handling functions
 
 import cv2
+import os
 import pygame
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def find_available_cameras():
-    """Check available camera devices and their indices."""
+from utils.ui import Button
+
+# Explicit capture backend, so OpenCV doesn't try every backend in turn when opening a camera
+CAMERA_BACKEND = cv2.CAP_DSHOW if os.name == 'nt' else cv2.CAP_ANY
+
+def _probe_camera(index):
+    """Return the index if the camera opens and delivers a frame, otherwise None."""
+    try:
+        cap = cv2.VideoCapture(index, CAMERA_BACKEND)
+        if cap.isOpened():
+            ret, frame = cap.read()
+            cap.release()
+            if ret:
+                print(f"Camera index {index} is working")
+                return index
+        else:
+            print(f"Camera index {index} is not available")
+    except Exception as e:
+        print(f"Error with camera index {index}: {e}")
+    return None
+
+def find_available_cameras(max_index=10, max_consecutive_misses=2):
+    """
+    Check available camera devices and their indices.
+    
+    Cameras are numbered contiguously from 0, so probing stops once
+    max_consecutive_misses indices in a row fail. Each batch of that many
+    indices is probed in parallel.
+    """
     available_cameras = []
+    misses = 0
     
-    # Check camera indices 0-9
-    for i in range(10):
-        try:
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                ret, frame = cap.read()
-                if ret:
-                    print(f"Camera index {i} is working")
-                    available_cameras.append(i)
-                cap.release()
-            else:
-                print(f"Camera index {i} is not available")
-        except Exception as e:
-            print(f"Error with camera index {i}: {e}")
+    with ThreadPoolExecutor(max_workers=max_consecutive_misses) as executor:
+        for start in range(0, max_index, max_consecutive_misses):
+            batch = range(start, min(start + max_consecutive_misses, max_index))
+            
+            # map() keeps index order
+            for result in executor.map(_probe_camera, batch):
+                if result is None:
+                    misses += 1
+                else:
+                    available_cameras.append(result)
+                    misses = 0
+            
+            if misses >= max_consecutive_misses:
+                break
     
     return available_cameras
 
-def select_camera(available_cameras):
-    """Let the user select a camera from the available ones using a GUI."""
+def select_camera(available_cameras, screen=None):
+    """
+    Let the user select a camera from the available ones using a GUI.
+    
+    Args:
+        available_cameras (list): Camera indices to choose from
+        screen (pygame.Surface): Existing display surface to draw on. If None,
+            a display is created, which resets any existing one.
+    """
     if not available_cameras:
         return None
     
@@ -33,18 +71,18 @@ def select_camera(available_cameras):
         print(f"Only one camera found (index {available_cameras[0]}), using it automatically.")
         return available_cameras[0]
     
-    # Initialize pygame for camera selection screen if not already initialized
-    screen_active = pygame.get_init()
-    if not screen_active:
-        pygame.init()
-    
-    screen = pygame.display.set_mode((800, 600))
-    pygame.display.set_caption("Camera Selection")
+    if screen is None:
+        # Initialize pygame for camera selection screen if not already initialized
+        screen_active = pygame.get_init()
+        if not screen_active:
+            pygame.init()
+        
+        screen = pygame.display.set_mode((800, 600))
+        pygame.display.set_caption("Camera Selection")
     font_title = pygame.font.SysFont(None, 48)
-    font_option = pygame.font.SysFont(None, 36)
     font_desc = pygame.font.SysFont(None, 24)
     
-    # Create buttons for each camera
+    # Create buttons for each camera, parallel to available_cameras
     buttons = []
     button_height = 60
     button_spacing = 20
@@ -52,71 +90,80 @@ def select_camera(available_cameras):
     
     for i, cam_idx in enumerate(available_cameras):
         y_pos = button_start_y + i * (button_height + button_spacing)
-        buttons.append({
-            'rect': pygame.Rect(250, y_pos, 300, button_height),
-            'index': cam_idx,
-            'text': f"Camera {cam_idx}",
-            'hover': False
-        })
+        buttons.append(Button(250, y_pos, 300, button_height, f"Camera {cam_idx}",
+                              (100, 100, 220), (120, 120, 255), (255, 255, 255)))
     
     # Main selection loop
-    clock = pygame.time.Clock()
     running = True
     selected_camera = None
+    first_frame = True
+    
+    # Hover is tracked from MOUSEMOTION events; start from the current cursor position
+    mouse_pos = pygame.mouse.get_pos()
+    mouse_moved = True
     
     while running:
-        mouse_pos = pygame.mouse.get_pos()
         mouse_clicked = False
         
-        for event in pygame.event.get():
+        # Block until an event arrives (or 16 ms pass) instead of spinning, then drain the rest
+        events = [pygame.event.wait(16)] + pygame.event.get()
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
+            if event.type == pygame.MOUSEMOTION:
+                mouse_pos = event.pos
+                mouse_moved = True
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
+                    mouse_pos = event.pos
                     mouse_clicked = True
         
-        # Handle button hovers and clicks
-        for button in buttons:
-            button['hover'] = button['rect'].collidepoint(mouse_pos)
-            if button['hover'] and mouse_clicked:
-                selected_camera = button['index']  # Get selected camera index
-                running = False
-                break
+        # Handle button hovers and clicks, remembering which buttons changed.
+        # Hover can only change when the mouse moved or clicked
+        dirty_buttons = []
+        if mouse_moved or mouse_clicked:
+            mouse_moved = False
+            for button, cam_idx in zip(buttons, available_cameras):
+                was_hovered = button.is_hovered
+                if button.check_hover(mouse_pos) != was_hovered:
+                    dirty_buttons.append(button)
+                if button.is_hovered and mouse_clicked:
+                    selected_camera = cam_idx  # Get selected camera index
+                    running = False
+                    break
         
-        # Draw selection screen
-        screen.fill((240, 240, 255))  # Light blue background
-        
-        # Draw title
-        title_text = font_title.render("Select Camera", True, (20, 20, 100))
-        title_rect = title_text.get_rect(center=(400, 100))
-        screen.blit(title_text, title_rect)
-        
-        # Draw description
-        desc_text = font_desc.render("Select which camera to use for hand tracking", True, (60, 60, 100))
-        desc_rect = desc_text.get_rect(center=(400, 150))
-        screen.blit(desc_text, desc_rect)
-        
-        # Draw buttons
-        for button in buttons:
-            # Button background
-            color = (120, 120, 255) if button['hover'] else (100, 100, 220)
-            pygame.draw.rect(screen, color, button['rect'])
-            pygame.draw.rect(screen, (0, 0, 0), button['rect'], 2)  # Border
+        if first_frame:
+            # Draw selection screen
+            screen.fill((240, 240, 255))  # Light blue background
+            
+            # Draw title
+            title_text = font_title.render("Select Camera", True, (20, 20, 100))
+            title_rect = title_text.get_rect(center=(400, 100))
+            screen.blit(title_text, title_rect)
             
-            # Button text
-            text = font_option.render(button['text'], True, (255, 255, 255))
-            text_rect = text.get_rect(center=button['rect'].center)
-            screen.blit(text, text_rect)
+            # Draw description
+            desc_text = font_desc.render("Select which camera to use for hand tracking", True, (60, 60, 100))
+            desc_rect = desc_text.get_rect(center=(400, 150))
+            screen.blit(desc_text, desc_rect)
+            dirty_buttons = buttons
         
-        pygame.display.flip()
-        clock.tick(60)
+        # Draw only buttons whose hover state changed
+        for button in dirty_buttons:
+            button.draw(screen)
+        
+        if first_frame:
+            pygame.display.flip()
+            first_frame = False
+        elif dirty_buttons:
+            pygame.display.update([button.rect for button in dirty_buttons])
     
     # Return the selected camera or default to first one
     return selected_camera if selected_camera is not None else (available_cameras[0] if available_cameras else None)
 
 def test_camera(camera_index):
     """Test if a camera works by displaying a preview window."""
-    cap = cv2.VideoCapture(camera_index)
+    cap = cv2.VideoCapture(camera_index, CAMERA_BACKEND)
     
     if not cap.isOpened():
         print(f"Error: Cannot open camera with index {camera_index}")
@@ -158,4 +205,106 @@ def test_camera(camera_index):
     cap.release()
     cv2.destroyAllWindows()
     
-    return True
\ No newline at end of file
+    return True
+
+class ThreadedCamera:
+    """Camera capture running on a background thread.
+    
+    The thread keeps grabbing frames into a single latest-frame slot so callers
+    never wait on the camera hardware. Exposes the same read/isOpened/release
+    calls as cv2.VideoCapture so it can be used as a drop-in replacement.
+    """
+    
+    def __init__(self, camera_index, width=640, height=480, transform_fn=None):
+        """
+        Open the camera and start the capture thread.
+        
+        Args:
+            camera_index (int): Index of the camera to open
+            width (int): Requested frame width
+            height (int): Requested frame height
+            transform_fn (callable): Optional function applied to each frame on the capture thread
+        """
+        self.camera_index = camera_index
+        self.transform_fn = transform_fn
+        
+        self.cap = cv2.VideoCapture(camera_index, CAMERA_BACKEND)
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        
+        # Latest-frame slot shared with the capture thread
+        self._cond = threading.Condition()
+        self._frame = None
+        self._frame_id = 0
+        self._read_id = 0
+        self._ok = self.cap.isOpened()
+        
+        # Cleared by pause() so the thread stops reading and transforming frames
+        self._active = threading.Event()
+        self._active.set()
+        
+        self.running = self._ok
+        self.thread = None
+        if self.running:
+            self.thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self.thread.start()
+    
+    def _capture_loop(self):
+        """Background thread: grab frames until stopped or the camera fails."""
+        while self.running:
+            # Sleep while paused; release() sets the event so the thread can exit
+            self._active.wait()
+            if not self.running:
+                break
+            
+            ok, frame = self.cap.read()
+            if ok and self.transform_fn is not None:
+                frame = self.transform_fn(frame)
+            
+            with self._cond:
+                if ok:
+                    self._frame = frame
+                    self._frame_id += 1
+                else:
+                    self._ok = False
+                    self.running = False
+                self._cond.notify_all()
+    
+    def read(self, timeout=2.0):
+        """
+        Return the newest frame that hasn't been returned yet.
+        
+        Waits up to `timeout` seconds for a new frame to arrive.
+        
+        Returns:
+            tuple: (ret, frame) like cv2.VideoCapture.read()
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._frame_id != self._read_id or not self._ok, timeout)
+            if not self._ok or self._frame_id == self._read_id:
+                return False, None
+            self._read_id = self._frame_id
+            return True, self._frame
+    
+    def pause(self):
+        """Stop grabbing frames until resume() is called."""
+        self._active.clear()
+    
+    def resume(self):
+        """Start grabbing frames again after pause()."""
+        with self._cond:
+            # The frame from before the pause is stale, don't hand it out
+            self._read_id = self._frame_id
+        self._active.set()
+    
+    def isOpened(self):
+        """Check whether the underlying camera is open."""
+        return self.cap.isOpened()
+    
+    def release(self):
+        """Stop the capture thread and release the camera."""
+        self.running = False
+        self._active.set()
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join(timeout=1.0)
+        self.cap.release()
@@ -2,15 +2,21 @@
 
 import pygame
 import numpy as np
-import os
-import io
+
+# Shared generator for synthesized noise; draws float32 directly instead of float64 + cast
+_rng = np.random.default_rng()
 
 class SoundManager:
+    # Envelopes shared by the synthesizers (at 22050 Hz), computed once
+    _FADE_100MS = np.linspace(1.0, 0.0, 2205, dtype=np.float32)
+    _FADE_200MS = np.linspace(1.0, 0.0, 4410, dtype=np.float32)
+    _EXP_DECAY = np.exp(-np.linspace(0, 10, 11025, dtype=np.float32))  # 0.5 s
+    
     def __init__(self):
         """Initialize the sound manager."""
-        # Initialize pygame mixer if not already done
+        # Initialize pygame mixer if not already done, in the format the sounds are synthesized in
         if not pygame.mixer.get_init():
-            pygame.mixer.init()
+            pygame.mixer.init(22050, -16, 1)
         
         print("Sound system initialized successfully")
         
@@ -26,17 +32,10 @@ class SoundManager:
     
     def create_engine_sounds(self):
         """Create synthesized engine sounds."""
-        # Idle engine sound (low frequency)
-        self.engine_idle = self.synthesize_engine_sound(220, 0.3)
-        print("Created synthesized engine idle sound")
-        
-        # Revving engine sound (higher frequency)
-        self.engine_revving = self.synthesize_engine_sound(330, 0.5)
-        print("Created synthesized engine revving sound")
-        
-        # Boost sound (even higher frequency)
-        self.engine_boost = self.synthesize_engine_sound(440, 0.8)
-        print("Created synthesized engine boost sound")
+        # Idle (low), revving (higher) and boost (even higher frequency) are synthesized together
+        self.engine_idle, self.engine_revving, self.engine_boost = self.synthesize_engine_sounds(
+            [220, 330, 440], [0.3, 0.5, 0.8])
+        print("Created synthesized engine idle, revving and boost sounds")
     
     def create_game_sounds(self):
         """Create game effect sounds."""
@@ -56,61 +55,62 @@ class SoundManager:
         self.game_over_sound = self.synthesize_game_over_sound()
         print("Created synthesized game over sound")
     
+    def _make_sound(self, samples, sample_rate):
+        """Create a Sound from mono 16-bit samples, adapting them to the mixer's rate and channels."""
+        mixer_rate, _, channels = pygame.mixer.get_init()
+        
+        # pygame.init() may have opened the mixer at another rate; resample like the WAV loader did
+        if mixer_rate != sample_rate:
+            count = int(len(samples) * mixer_rate / sample_rate)
+            positions = np.arange(count) * (sample_rate / mixer_rate)
+            samples = np.interp(positions, np.arange(len(samples)), samples).astype(np.int16)
+        
+        if channels > 1:
+            samples = np.repeat(samples[:, np.newaxis], channels, axis=1)
+        
+        return pygame.sndarray.make_sound(np.ascontiguousarray(samples))
+    
     def synthesize_engine_sound(self, frequency, volume):
         """Create a synthetic engine sound."""
-        # Create a short sample (~1 second) of engine sound
+        return self.synthesize_engine_sounds([frequency], [volume])[0]
+    
+    def synthesize_engine_sounds(self, frequencies, volumes):
+        """Create one synthetic engine sound per frequency/volume pair in a single batch."""
+        # Create short samples (~1 second) of engine sound, one row per sound
         sample_rate = 22050
-        samples = np.sin(2 * np.pi * frequency * np.arange(sample_rate) / sample_rate)
+        t = np.arange(sample_rate, dtype=np.float32) / sample_rate
+        w = 2 * np.pi * np.asarray(frequencies, dtype=np.float32)[:, np.newaxis] * t
         
-        # Add harmonics for richer sound
-        samples += 0.5 * np.sin(2 * np.pi * (frequency * 2) * np.arange(sample_rate) / sample_rate)
-        samples += 0.25 * np.sin(2 * np.pi * (frequency * 3) * np.arange(sample_rate) / sample_rate)
+        # Fundamental plus harmonics for richer sound, sharing one time base
+        samples = np.sin(w) + 0.5 * np.sin(2 * w) + 0.25 * np.sin(3 * w)
         
         # Add noise for realism
-        samples += 0.1 * np.random.random(sample_rate)
+        samples += 0.1 * _rng.random(samples.shape, dtype=np.float32)
         
-        # Normalize and scale by volume
-        samples = (samples / np.max(np.abs(samples))) * volume
+        # Normalize each row and scale by its volume
+        volumes = np.asarray(volumes, dtype=np.float32)[:, np.newaxis]
+        samples = (samples / np.max(np.abs(samples), axis=1, keepdims=True)) * volumes
         
         # Convert to 16-bit PCM
         samples = (samples * 32767).astype(np.int16)
         
-        # Create sound from buffer
-        buffer = io.BytesIO()
-        import wave
-        with wave.open(buffer, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(samples.tobytes())
-        
-        buffer.seek(0)
-        return pygame.mixer.Sound(buffer)
+        # Create sounds directly from the sample rows
+        return [self._make_sound(row, sample_rate) for row in samples]
     
     def synthesize_collision_sound(self):
         """Create a collision sound effect."""
         sample_rate = 22050
         duration = 0.5  # Short duration
-        samples = np.random.random(int(sample_rate * duration)) * 2 - 1
+        samples = _rng.random(int(sample_rate * duration), dtype=np.float32) * 2 - 1
         
         # Apply envelope
-        envelope = np.exp(-np.linspace(0, 10, int(sample_rate * duration)))
-        samples = samples * envelope
+        samples = samples * self._EXP_DECAY
         
         # Convert to 16-bit PCM
         samples = (samples * 32767).astype(np.int16)
         
-        # Create sound from buffer
-        buffer = io.BytesIO()
-        import wave
-        with wave.open(buffer, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(samples.tobytes())
-        
-        buffer.seek(0)
-        return pygame.mixer.Sound(buffer)
+        # Create sound directly from the sample array
+        return self._make_sound(samples, sample_rate)
     
     def synthesize_powerup_sound(self):
         """Create a power-up sound effect."""
@@ -118,31 +118,18 @@ class SoundManager:
         duration = 0.6
         
         # Ascending frequency
-        samples = np.zeros(int(sample_rate * duration))
-        for i in range(int(sample_rate * duration)):
-            t = i / sample_rate
-            freq = 440 + t * 1000
-            samples[i] = np.sin(2 * np.pi * freq * t)
+        t = np.arange(int(sample_rate * duration)) / sample_rate
+        freq = 440 + t * 1000
+        samples = np.sin(2 * np.pi * freq * t)
         
-        # Apply envelope
-        envelope = np.ones_like(samples)
-        envelope[-int(0.1 * sample_rate):] = np.linspace(1, 0, int(0.1 * sample_rate))
-        samples = samples * envelope
+        # Apply envelope (fade out over the last 100 ms)
+        samples[-len(self._FADE_100MS):] *= self._FADE_100MS
         
         # Convert to 16-bit PCM
         samples = (samples * 32767).astype(np.int16)
         
-        # Create sound from buffer
-        buffer = io.BytesIO()
-        import wave
-        with wave.open(buffer, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(samples.tobytes())
-        
-        buffer.seek(0)
-        return pygame.mixer.Sound(buffer)
+        # Create sound directly from the sample array
+        return self._make_sound(samples, sample_rate)
     
     def synthesize_brake_sound(self):
         """Create a braking sound effect."""
@@ -150,35 +137,22 @@ class SoundManager:
         duration = 0.4
         
         # Descending frequency
-        samples = np.zeros(int(sample_rate * duration))
-        for i in range(int(sample_rate * duration)):
-            t = i / sample_rate
-            freq = 880 - t * 600
-            samples[i] = np.sin(2 * np.pi * freq * t)
+        t = np.arange(int(sample_rate * duration)) / sample_rate
+        freq = 880 - t * 600
+        samples = np.sin(2 * np.pi * freq * t)
         
         # Add friction noise
-        noise = np.random.random(int(sample_rate * duration)) * 0.3
+        noise = _rng.random(int(sample_rate * duration), dtype=np.float32) * 0.3
         samples = samples + noise
         
-        # Apply envelope
-        envelope = np.ones_like(samples)
-        envelope[-int(0.1 * sample_rate):] = np.linspace(1, 0, int(0.1 * sample_rate))
-        samples = samples * envelope
+        # Apply envelope (fade out over the last 100 ms)
+        samples[-len(self._FADE_100MS):] *= self._FADE_100MS
         
         # Convert to 16-bit PCM
         samples = (samples * 32767).astype(np.int16)
         
-        # Create sound from buffer
-        buffer = io.BytesIO()
-        import wave
-        with wave.open(buffer, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(samples.tobytes())
-        
-        buffer.seek(0)
-        return pygame.mixer.Sound(buffer)
+        # Create sound directly from the sample array
+        return self._make_sound(samples, sample_rate)
     
     def synthesize_game_over_sound(self):
         """Create a game over sound effect."""
@@ -200,25 +174,14 @@ class SoundManager:
         tremolo = 0.5 + 0.5 * np.sin(2 * np.pi * 8 * np.arange(len(samples)) / sample_rate)
         samples = samples * tremolo
         
-        # Apply overall envelope
-        envelope = np.ones_like(samples)
-        envelope[-int(0.2 * sample_rate):] = np.linspace(1, 0, int(0.2 * sample_rate))
-        samples = samples * envelope
+        # Apply overall envelope (fade out over the last 200 ms)
+        samples[-len(self._FADE_200MS):] *= self._FADE_200MS
         
         # Convert to 16-bit PCM
         samples = (samples * 32767).astype(np.int16)
         
-        # Create sound from buffer
-        buffer = io.BytesIO()
-        import wave
-        with wave.open(buffer, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(samples.tobytes())
-        
-        buffer.seek(0)
-        return pygame.mixer.Sound(buffer)
+        # Create sound directly from the sample array
+        return self._make_sound(samples, sample_rate)
     
     def update_engine_sound(self, speed, braking, boost):
         """Update engine sound based on car state."""
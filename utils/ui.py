@@ -1,9 +1,68 @@
 # utils/ui.py - UI elements for the game
 
 import pygame
+import numpy as np
 import config
 
+# Surface.fblits (pygame 2.4+) blits a whole sequence in one C call; older versions fall back to blits
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+# Mute button colors
+_BTN_COLOR_MUTED = (200, 50, 50)
+_BTN_COLOR_ACTIVE = (50, 200, 50)
+_BTN_BORDER = (0, 0, 0)
+_SPEAKER_COLOR = (255, 255, 255)
+_X_COLOR = (255, 0, 0)
+
+class Button:
+    """Clickable rectangle with a centered text label, shared by the menus."""
+    
+    def __init__(self, x, y, width, height, text, color, hover_color, text_color, font_size=36):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.color = color
+        self.hover_color = hover_color
+        self.text_color = text_color
+        self.font_size = font_size
+        self.font = pygame.font.SysFont(None, font_size)  # Loaded once, not every frame
+        self.is_hovered = False
+        self.text = text  # Renders the label
+    
+    @property
+    def text(self):
+        return self._text
+    
+    @text.setter
+    def text(self, value):
+        # Re-render the label only when the text changes
+        self._text = value
+        self._text_surf = self.font.render(value, True, self.text_color).convert_alpha()
+        self._text_rect = self._text_surf.get_rect(center=self.rect.center)
+        
+    def draw(self, screen):
+        # Draw button rectangle
+        color = self.hover_color if self.is_hovered else self.color
+        pygame.draw.rect(screen, color, self.rect)
+        pygame.draw.rect(screen, _BTN_BORDER, self.rect, 2)  # Border
+        
+        # Draw button text
+        screen.blit(self._text_surf, self._text_rect)
+    
+    def check_hover(self, pos):
+        self.is_hovered = self.rect.collidepoint(pos)
+        return self.is_hovered
+    
+    def is_clicked(self, pos, click):
+        return self.rect.collidepoint(pos) and click
+    
+    def handle(self, pos, clicked):
+        """Update hover state and report a click with a single containment test."""
+        inside = self.rect.collidepoint(pos)
+        self.is_hovered = inside
+        return inside and clicked
+
 class GameUI:
+    TEXT_CACHE_SIZE = 64
+    
     def __init__(self, screen, game_mode):
         self.screen = screen
         self.game_mode = game_mode
@@ -15,108 +74,224 @@ class GameUI:
         self.highlight_color = (50, 200, 50)
         self.panel_color = (220, 220, 240, 180)  # Semi-transparent
         
+        # Fonts are loaded once instead of on every draw
+        self.font_mode = pygame.font.SysFont(None, 24)
+        self.font_stats = pygame.font.SysFont(None, 30)
+        self.font_large = pygame.font.SysFont(None, 36)
+        
+        # Text that doesn't change during a game is rendered once. Surfaces blitted every
+        # frame are converted to the display format so blits don't convert pixels
+        self._mode_surf = self.font_mode.render(f"Mode: {self.mode_settings['name']}", True, self.text_color).convert_alpha()
+        self._sound_label_surf = self.font_mode.render("Sound", True, (0, 0, 0))
+        self._muted_indicator_surf = self.font_large.render("SOUND MUTED", True, (255, 0, 0)).convert_alpha()
+        self._status_surfs = {
+            True: self.font_mode.render("MUTED", True, (255, 0, 0)),
+            False: self.font_mode.render("ON", True, (0, 128, 0))
+        }
+        
+        # Last rendered stat surfaces as (value, surface); re-rendered only when the value changes
+        self._score_cache = (None, None)
+        self._collisions_cache = (None, None)
+        self._time_cache = (None, None)
+        
+        # Rendered text surfaces keyed by (font, text, color), so values that come back
+        # (speed going up and down) reuse their surface. Bounded to TEXT_CACHE_SIZE entries
+        self._text_cache = {}
+        
+        # " / MM:SS" suffix for the current time limit, rebuilt only when the limit changes
+        self._time_limit = None
+        self._time_limit_suffix = ""
+        
         # UI elements positions
         self.panel_rect = pygame.Rect(10, 10, 200, 180)
         
+        # Semi-transparent stats panel background, built once
+        self._panel_surface = pygame.Surface(self.panel_rect.size, pygame.SRCALPHA)
+        self._panel_surface.fill(self.panel_color)
+        self._panel_surface = self._panel_surface.convert_alpha()  # Match the display format so blits don't convert
+        
+        # Composed stats panel, rebuilt only when the displayed values change
+        self._hud_panel = self._panel_surface.copy()
+        self._last_state = None
+        
         # Create mute button
         self.mute_button_rect = pygame.Rect(20, 550, 40, 40)
         self.sound_muted = False
+        
+        # Area covered by the button plus its "Sound" and status labels
+        self._sound_label_pos = (self.mute_button_rect.left - 5, self.mute_button_rect.bottom + 5)
+        self._status_pos = (self.mute_button_rect.right + 10, self.mute_button_rect.top + 15)
+        self._mute_widget_rect = self.mute_button_rect.unionall(
+            [self._sound_label_surf.get_rect(topleft=self._sound_label_pos)] +
+            [surf.get_rect(topleft=self._status_pos) for surf in self._status_surfs.values()])
+        
+        # Whole mute widget pre-rendered for both states
+        self._mute_button_surfs = {
+            False: self._build_mute_button(False),
+            True: self._build_mute_button(True)
+        }
+        
+        # Blit positions don't change, so the (surface, position) list draw() hands to
+        # fblits is built once per mute state. The panel surface is recomposed in place
+        self._muted_indicator_pos = (325, 20)
+        unmuted_ops = [
+            (self._hud_panel, self.panel_rect.topleft),
+            (self._mute_button_surfs[False], self._mute_widget_rect.topleft)
+        ]
+        muted_ops = [
+            (self._hud_panel, self.panel_rect.topleft),
+            (self._mute_button_surfs[True], self._mute_widget_rect.topleft),
+            (self._muted_indicator_surf, self._muted_indicator_pos)  # Mute indicator at the top of the screen
+        ]
+        self._draw_ops = {False: unmuted_ops, True: muted_ops}
+        
+        # Screen areas draw() touches, per mute state. None means the areas add up to more
+        # than the screen, where a full flip is cheaper than updating them one by one
+        muted_indicator_rect = self._muted_indicator_surf.get_rect(topleft=self._muted_indicator_pos)
+        self._dirty_rects = {
+            False: self._limit_dirty_rects([self.panel_rect, self._mute_widget_rect]),
+            True: self._limit_dirty_rects([self.panel_rect, self._mute_widget_rect, muted_indicator_rect])
+        }
     
     def draw(self, score, collisions, speed, time_elapsed, time_limit=None):
-        """Draw all UI elements."""
-        # Draw stats panel background
-        panel_surface = pygame.Surface((self.panel_rect.width, self.panel_rect.height), pygame.SRCALPHA)
-        panel_surface.fill(self.panel_color)
-        self.screen.blit(panel_surface, self.panel_rect.topleft)
+        """Draw all UI elements.
+        
+        Returns the list of screen rects that were drawn, for pygame.display.update(),
+        or None if the caller should flip the whole display instead.
+        """
+        # Change color if time limit is close
+        time_color = self.text_color
+        if time_limit and time_limit - time_elapsed < 10:
+            time_color = self.warning_color
+        
+        # The stats panel is only recomposed when a displayed value changes
+        state = (int(score), collisions, round(speed, 1), int(time_elapsed), time_limit, time_color)
+        if state != self._last_state:
+            self._last_state = state
+            self._compose_panel(score, collisions, speed, time_elapsed, time_limit, time_color)
+        
+        # Panel, mute button and (when muted) the muted banner are blitted in one batch
+        ops = self._draw_ops[self.sound_muted]
+        if _HAS_FBLITS:
+            self.screen.fblits(ops, 0)
+        else:
+            self.screen.blits(ops, doreturn=False)
         
-        # Draw game mode
-        font_mode = pygame.font.SysFont(None, 24)
-        mode_text = font_mode.render(f"Mode: {self.mode_settings['name']}", True, self.text_color)
-        self.screen.blit(mode_text, (self.panel_rect.left + 10, self.panel_rect.top + 10))
+        return self._dirty_rects[self.sound_muted]
+    
+    def _compose_panel(self, score, collisions, speed, time_elapsed, time_limit, time_color):
+        """Render the stats panel (background, mode and stats) into self._hud_panel."""
+        # Stats panel background and game mode
+        ops = [
+            (self._panel_surface, (0, 0)),
+            (self._mode_surf, (10, 10))
+        ]
         
         # Draw score
-        font_stats = pygame.font.SysFont(None, 30)
-        score_text = font_stats.render(f"Score: {int(score)}", True, self.highlight_color)
-        self.screen.blit(score_text, (self.panel_rect.left + 10, self.panel_rect.top + 40))
+        font_stats = self.font_stats
+        score_value = int(score)
+        if score_value != self._score_cache[0]:
+            self._score_cache = (score_value, self._get_text(font_stats, f"Score: {score_value}", self.highlight_color))
+        ops.append((self._score_cache[1], (10, 40)))
         
         # Draw collisions
-        collision_color = self.warning_color if collisions > 0 else self.text_color
-        collision_text = font_stats.render(f"Collisions: {collisions}", True, collision_color)
-        self.screen.blit(collision_text, (self.panel_rect.left + 10, self.panel_rect.top + 70))
+        if collisions != self._collisions_cache[0]:
+            collision_color = self.warning_color if collisions > 0 else self.text_color
+            self._collisions_cache = (collisions, self._get_text(font_stats, f"Collisions: {collisions}", collision_color))
+        ops.append((self._collisions_cache[1], (10, 70)))
         
         # Draw speed
-        speed_text = font_stats.render(f"Speed: {speed:.1f}", True, self.text_color)
-        self.screen.blit(speed_text, (self.panel_rect.left + 10, self.panel_rect.top + 100))
+        speed_text = self._get_text(font_stats, f"Speed: {speed:.1f}", self.text_color)
+        ops.append((speed_text, (10, 100)))
         
-        # Draw time (format as MM:SS)
-        minutes = int(time_elapsed) // 60
-        seconds = int(time_elapsed) % 60
-        time_str = f"{minutes:02d}:{seconds:02d}"
+        # Draw time (format as MM:SS), re-rendering only when the shown second or color changes
+        elapsed_seconds = int(time_elapsed)
+        time_key = (elapsed_seconds, time_limit, time_color)
+        if time_key != self._time_cache[0]:
+            self.set_time_limit(time_limit)
+            minutes, seconds = divmod(elapsed_seconds, 60)
+            time_str = f"Time: {minutes:02d}:{seconds:02d}{self._time_limit_suffix}"
+            self._time_cache = (time_key, self._get_text(font_stats, time_str, time_color))
+        ops.append((self._time_cache[1], (10, 130)))
         
-        # Change color if time limit is close
-        time_color = self.text_color
-        if time_limit:
-            time_left = time_limit - time_elapsed
-            if time_left < 10:
-                time_color = self.warning_color
-            time_str = f"Time: {time_str} / {int(time_limit)//60:02d}:{int(time_limit)%60:02d}"
+        # The panel background replaces the previous contents; text blends on top of it
+        self._hud_panel.fill((0, 0, 0, 0))
+        if _HAS_FBLITS:
+            self._hud_panel.fblits(ops, 0)
         else:
-            time_str = f"Time: {time_str}"
-            
-        time_text = font_stats.render(time_str, True, time_color)
-        self.screen.blit(time_text, (self.panel_rect.left + 10, self.panel_rect.top + 130))
+            self._hud_panel.blits(ops, doreturn=False)
+    
+    def _limit_dirty_rects(self, rects):
+        """Return rects, or None if their total area is at least the screen's."""
+        screen_area = self.screen.get_width() * self.screen.get_height()
+        if sum(rect.width * rect.height for rect in rects) >= screen_area:
+            return None
+        return rects
+    
+    def _get_text(self, font, text, color):
+        """Return a rendered text surface, reusing a cached one when available."""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._text_cache[next(iter(self._text_cache))]
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
+    def set_time_limit(self, time_limit):
+        """Set the time limit shown after the elapsed time (None or 0 for no limit)."""
+        if time_limit != self._time_limit:
+            self._time_limit = time_limit
+            if time_limit:
+                limit_minutes, limit_seconds = divmod(int(time_limit), 60)
+                self._time_limit_suffix = f" / {limit_minutes:02d}:{limit_seconds:02d}"
+            else:
+                self._time_limit_suffix = ""
+    
+    def _build_mute_button(self, muted):
+        """Render the mute button, speaker icon and labels for one mute state."""
+        widget = pygame.Surface(self._mute_widget_rect.size, pygame.SRCALPHA)
+        origin = self._mute_widget_rect.topleft
         
-        # Draw mute button
-        self.draw_mute_button()
+        def local(pos):
+            return (pos[0] - origin[0], pos[1] - origin[1])
+        
+        # Button primitives are drawn in button-local coordinates
+        surface = widget.subsurface(pygame.Rect(local(self.mute_button_rect.topleft), self.mute_button_rect.size))
+        rect = surface.get_rect()
         
-        # Add mute indicator at the top of the screen when muted
-        if self.sound_muted:
-            font_large = pygame.font.SysFont(None, 36)
-            mute_indicator = font_large.render("SOUND MUTED", True, (255, 0, 0))
-            self.screen.blit(mute_indicator, (325, 20))
-    
-    def draw_mute_button(self):
-        """Draw mute/unmute button."""
         # Draw button background
-        button_color = (200, 50, 50) if self.sound_muted else (50, 200, 50)
-        pygame.draw.rect(self.screen, button_color, self.mute_button_rect)
-        pygame.draw.rect(self.screen, (0, 0, 0), self.mute_button_rect, 2)  # Black border
+        button_color = _BTN_COLOR_MUTED if muted else _BTN_COLOR_ACTIVE
+        pygame.draw.rect(surface, button_color, rect)
+        pygame.draw.rect(surface, _BTN_BORDER, rect, 2)  # Black border
         
-        # Draw speaker icon
-        speaker_color = (255, 255, 255)  # White icon
+        # Draw speaker icon (white)
         
         # Draw speaker base
-        pygame.draw.rect(self.screen, speaker_color, 
-                        (self.mute_button_rect.left + 10, self.mute_button_rect.top + 15, 8, 10))
+        pygame.draw.rect(surface, _SPEAKER_COLOR, (10, 15, 8, 10))
         
         # Draw speaker cone
-        points = [
-            (self.mute_button_rect.left + 18, self.mute_button_rect.top + 10),
-            (self.mute_button_rect.left + 28, self.mute_button_rect.top + 5),
-            (self.mute_button_rect.left + 28, self.mute_button_rect.top + 35),
-            (self.mute_button_rect.left + 18, self.mute_button_rect.top + 30)
-        ]
-        pygame.draw.polygon(self.screen, speaker_color, points)
+        pygame.draw.polygon(surface, _SPEAKER_COLOR, [(18, 10), (28, 5), (28, 35), (18, 30)])
         
         # Draw X over speaker if muted
-        if self.sound_muted:
-            pygame.draw.line(self.screen, (255, 0, 0), 
-                            (self.mute_button_rect.left + 8, self.mute_button_rect.top + 8),
-                            (self.mute_button_rect.left + 32, self.mute_button_rect.top + 32), 3)
-            pygame.draw.line(self.screen, (255, 0, 0), 
-                            (self.mute_button_rect.left + 32, self.mute_button_rect.top + 8),
-                            (self.mute_button_rect.left + 8, self.mute_button_rect.top + 32), 3)
+        if muted:
+            pygame.draw.line(surface, _X_COLOR, (8, 8), (32, 32), 3)
+            pygame.draw.line(surface, _X_COLOR, (32, 8), (8, 32), 3)
         
         # Draw label for mute button
-        font = pygame.font.SysFont(None, 24)
-        mute_label = font.render("Sound", True, (0, 0, 0))
-        self.screen.blit(mute_label, (self.mute_button_rect.left - 5, self.mute_button_rect.bottom + 5))
+        widget.blit(self._sound_label_surf, local(self._sound_label_pos))
         
         # Draw muted status text
-        status_text = "MUTED" if self.sound_muted else "ON"
-        status_color = (255, 0, 0) if self.sound_muted else (0, 128, 0)
-        status_label = font.render(status_text, True, status_color)
-        self.screen.blit(status_label, (self.mute_button_rect.right + 10, self.mute_button_rect.top + 15))
+        widget.blit(self._status_surfs[muted], local(self._status_pos))
+        
+        return widget.convert_alpha()
+    
+    def draw_mute_button(self):
+        """Draw mute/unmute button."""
+        # Button, icon and labels are pre-rendered for both states
+        self.screen.blit(self._mute_button_surfs[self.sound_muted], self._mute_widget_rect.topleft)
     
     def check_mute_button_click(self, pos):
         """Check if mouse clicked on mute button and toggle mute state."""
@@ -134,37 +309,90 @@ class MenuUI:
         self.screen = screen
         self.screen_width, self.screen_height = screen.get_size()
         self.font = pygame.font.SysFont('Arial', 24)
-        self.buttons = {}
+        
+        # Buttons are stored as parallel lists (one entry per button, in insertion order)
+        # plus an (N, 4) array of x, y, width, height so hover tests run as one vectorized
+        # comparison. _button_index maps a button name to its position for lookups
+        self._button_index = {}
+        self._rects = []
+        self._rect_array = np.empty((0, 4), dtype=np.int32)
+        self._color_pairs = []  # (color, hover_color), indexed by the hover flag
+        self._texts = []
+        self._text_surfs = []
+        self._text_rects = []
+        self._actions = []
+        # Union of every button rect, used as a broad-phase test before the per-button one
+        self._buttons_bbox = None
         self.create_buttons()
         
     def create_buttons(self):
         # Define run button
-        run_button = {
-            'rect': pygame.Rect(self.screen_width // 2 - 50, self.screen_height - 80, 100, 40),
-            'color': (50, 200, 50),
-            'hover_color': (100, 250, 100),
-            'text': 'Run Game',
-            'action': 'run_game'
-        }
-        self.buttons['run_game'] = run_button
+        self.add_button(
+            'run_game',
+            pygame.Rect(self.screen_width // 2 - 50, self.screen_height - 80, 100, 40),
+            (50, 200, 50),
+            (100, 250, 100),
+            'Run Game',
+            'run_game'
+        )
+    
+    def add_button(self, name, rect, color, hover_color, text, action):
+        """Add a button to the menu."""
+        self._button_index[name] = len(self._rects)
+        self._rects.append(rect)
+        self._rect_array = np.vstack([self._rect_array, np.array([tuple(rect)], dtype=np.int32)])
+        self._color_pairs.append((color, hover_color))
+        self._texts.append(text)
+        self._actions.append(action)
+        if self._buttons_bbox is None:
+            self._buttons_bbox = rect.copy()
+        else:
+            self._buttons_bbox.union_ip(rect)
+        
+        # The label and its centered position never change, so render them once
+        text_surf = self.font.render(text, True, (0, 0, 0)).convert_alpha()
+        self._text_surfs.append(text_surf)
+        self._text_rects.append(text_surf.get_rect(center=rect.center))
     
-    def draw_buttons(self):
-        mouse_pos = pygame.mouse.get_pos()
-        for button_name, button in self.buttons.items():
+    def _hover_mask(self, mouse_pos):
+        """Return a boolean array telling which buttons contain mouse_pos."""
+        # Outside the union of all buttons nothing can be hovered, so skip the per-button test
+        if self._buttons_bbox is None or not self._buttons_bbox.collidepoint(mouse_pos):
+            return np.zeros(len(self._rects), dtype=bool)
+        mx, my = mouse_pos
+        rects = self._rect_array
+        return ((rects[:, 0] <= mx) & (mx < rects[:, 0] + rects[:, 2]) &
+                (rects[:, 1] <= my) & (my < rects[:, 1] + rects[:, 3]))
+    
+    def draw_buttons(self, mouse_pos=None):
+        # Callers that already read the mouse position this frame can pass it in
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
+        # Plain Python bools so they can index the (color, hover_color) pairs
+        hover = self._hover_mask(mouse_pos).tolist()
+        
+        # Bind the names used per button to locals to skip repeated attribute lookups
+        screen = self.screen
+        draw_rect = pygame.draw.rect
+        blit = screen.blit
+        
+        for rect, colors, hovered, text_surf, text_rect in zip(
+                self._rects, self._color_pairs, hover, self._text_surfs, self._text_rects):
             # Change color when hovering
-            color = button['hover_color'] if button['rect'].collidepoint(mouse_pos) else button['color']
+            color = colors[hovered]
             
             # Draw button rectangle
-            pygame.draw.rect(self.screen, color, button['rect'])
-            pygame.draw.rect(self.screen, (0, 0, 0), button['rect'], 2)  # Border
+            draw_rect(screen, color, rect)
+            draw_rect(screen, _BTN_BORDER, rect, 2)  # Border
             
             # Draw button text
-            text_surf = self.font.render(button['text'], True, (0, 0, 0))
-            text_rect = text_surf.get_rect(center=button['rect'].center)
-            self.screen.blit(text_surf, text_rect)
+            blit(text_surf, text_rect)
     
     def check_button_click(self, mouse_pos):
-        for button_name, button in self.buttons.items():
-            if button['rect'].collidepoint(mouse_pos):
-                return button['action']
-        return None
\ No newline at end of file
+        bbox = self._buttons_bbox
+        if bbox is None or not bbox.collidepoint(mouse_pos):
+            return None
+        hover = self._hover_mask(mouse_pos)
+        if hover.any():
+            return self._actions[int(np.argmax(hover))]
+        return None